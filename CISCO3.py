@@ -1,31 +1,27 @@
-import os
 import re
 import json
-import paramiko
 import streamlit as st
-from typing import List, Optional, Tuple
+from typing import List, Optional
 from datetime import datetime
-from dotenv import load_dotenv
 
-# 加载环境变量
-load_dotenv()  # 从.env文件加载（开发环境）
+from services import (
+    DEEPSEEK_API_URL,
+    auth_headers,
+    get_api_key,
+    get_http_session,
+    new_ssh_client,
+)
 
-# 安全获取API密钥
-def get_api_key() -> str:
-    key = os.getenv("DEEPSEEK_API_KEY")
-    if not key:
-        raise ValueError("DEEPSEEK_API_KEY环境变量未配置")
-    if key.startswith("sk-"):
-        return key
-    raise ValueError("无效的API密钥格式")
-
-# 配置类
+# 配置类（API密钥按需解析，缺失时仅影响命令生成，不会导致整个应用崩溃）
 class AppConfig:
-    API_URL = "https://api.deepseek.com/v1/chat/completions"
-    HEADERS = {"Authorization": f"Bearer {get_api_key()}", "Content-Type": "application/json"}
+    API_URL = DEEPSEEK_API_URL
     CISCO_PROMPT_PATTERN = r"[\w-]+(\(config\))?#|>"
     HISTORY_FILE = "connection_history.json"
 
+    @staticmethod
+    def headers() -> dict:
+        return auth_headers(get_api_key())
+
 # 命令生成模块
 class CommandGenerator:
     @staticmethod
@@ -45,9 +41,10 @@ class CommandGenerator:
         实际输入：{nl_text}"""
 
         try:
-            response = requests.post(
+            headers = AppConfig.headers()
+            response = get_http_session().post(
                 AppConfig.API_URL,
-                headers=AppConfig.HEADERS,
+                headers=headers,
                 json={
                     "model": "deepseek-chat",
                     "messages": [{"role": "user", "content": prompt}],
@@ -87,8 +84,7 @@ class CiscoConnector:
         self.host = host
         self.user = user
         self.password = password
-        self.client = paramiko.SSHClient()
-        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self.client = new_ssh_client()
 
     def __enter__(self):
         try:
@@ -133,7 +129,10 @@ class HistoryManager:
     def load() -> List[dict]:
         try:
             with open(AppConfig.HISTORY_FILE, "r") as f:
-                return json.load(f)
+                history = json.load(f)
+            # 跳过格式不符的旧记录，避免渲染历史时崩溃
+            return [item for item in history
+                    if isinstance(item, dict) and {"time", "commands", "output"} <= item.keys()]
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
@@ -0,0 +1,97 @@
+import os
+import sys
+import json
+import subprocess
+
+# 冷启动基准：每项指标都在独立的新子进程中测量
+#   import_s  —— 导入脚本模块耗时（不含 streamlit 本身）
+#   render_s  —— 首次渲染耗时：从导入 streamlit 之前开始计时，到 AppTest 首次执行脚本结束
+#   heavy     —— 导入脚本后新加载的重量级依赖（理想情况下为空）
+# 用法：python bench_cold_start.py [--repeat N] > bench_output.txt
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APPS = ["CISCO3.py", "cisco.py", "cisco2.py", "main.py"]
+HEAVY_MODULES = ["paramiko", "requests", "transformers", "dotenv"]
+
+# 子进程公共前缀：仓库根目录下的 streamlit.py 会遮蔽真正的 streamlit 包，
+# 先从 sys.path 中移除根目录再导入 streamlit，导入后再把根目录加回以便导入 services
+PRELUDE = r"""
+import os, sys, json, time
+start = time.perf_counter()
+root, app, heavy = sys.argv[1], sys.argv[2], sys.argv[3].split(",")
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != root]
+try:
+    import streamlit
+except ImportError as e:
+    sys.exit(f"streamlit 未安装: {e}")
+if os.path.abspath(streamlit.__file__).startswith(root + os.sep):
+    sys.exit(f"streamlit 被仓库内文件遮蔽: {streamlit.__file__}")
+sys.path.append(root)
+"""
+
+IMPORT_PROBE = PRELUDE + r"""
+import importlib.util
+before = set(sys.modules)
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("bench_app", os.path.join(root, app))
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+import_s = time.perf_counter() - start
+loaded = [name for name in heavy if name in sys.modules and name not in before]
+print(json.dumps({"import_s": round(import_s, 4), "heavy": loaded}))
+"""
+
+RENDER_PROBE = PRELUDE + r"""
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(os.path.join(root, app), default_timeout=60)
+at.run()
+render_s = time.perf_counter() - start
+if at.exception:
+    sys.exit(f"渲染异常: {at.exception[0].value}")
+print(json.dumps({"render_s": round(render_s, 4)}))
+"""
+
+
+def run_probe(probe: str, app: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", probe, ROOT, app, ",".join(HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        stderr = proc.stderr.strip().splitlines()
+        return {"error": stderr[-1] if stderr else f"退出码 {proc.returncode}，无输出"}
+    try:
+        return json.loads(lines[-1])
+    except json.JSONDecodeError:
+        return {"error": f"无法解析输出: {lines[-1]}"}
+
+
+def measure(probe: str, app: str, key: str, repeat: int):
+    """重复测量取最小值，返回 (最小值, 最后一次结果)；全部失败时最小值为 None"""
+    runs = [run_probe(probe, app) for _ in range(repeat)]
+    ok = [r for r in runs if "error" not in r]
+    return (min(r[key] for r in ok) if ok else None), (ok or runs)[-1]
+
+
+def main():
+    repeat = int(sys.argv[sys.argv.index("--repeat") + 1]) if "--repeat" in sys.argv else 3
+    print(f"{'app':<12}{'import_s':>10}{'render_s':>10}  heavy")
+    for app in APPS:
+        import_s, import_run = measure(IMPORT_PROBE, app, "import_s", repeat)
+        render_s, render_run = measure(RENDER_PROBE, app, "render_s", repeat)
+        heavy = ",".join(import_run.get("heavy", [])) or "-"
+        print(
+            f"{app:<12}"
+            f"{'失败' if import_s is None else f'{import_s:.4f}':>10}"
+            f"{'失败' if render_s is None else f'{render_s:.4f}':>10}  {heavy}"
+        )
+        for name, run in (("import", import_run), ("render", render_run)):
+            if "error" in run:
+                print(f"{'':<12}  {name}_error: {run['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,15 @@
 import streamlit as st
-import requests
-import paramiko
 import time
 import re
 from io import StringIO
 
-# DeepSeek API配置
-DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
-API_KEY = "sk-82879fc3191d4718894b5d96ca96da06"
-HEADERS = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+from services import (
+    DEEPSEEK_API_URL,
+    auth_headers,
+    get_api_key,
+    get_http_session,
+    new_ssh_client,
+)
 
 
 # 生成Cisco命令（优化prompt）
@@ -33,7 +34,8 @@ def generate_cisco_command(nl_text):
     }
 
     try:
-        response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=payload, timeout=10)
+        headers = auth_headers(get_api_key())
+        response = get_http_session().post(DEEPSEEK_API_URL, headers=headers, json=payload, timeout=10)
         response.raise_for_status()
         return response.json()["choices"][0]["message"]["content"]
     except Exception as e:
@@ -43,8 +45,7 @@ def generate_cisco_command(nl_text):
 
 # 优化后的SSH执行函数（完整回显）
 def ssh_execute_optimized(host, username, password, commands, timeout=15):
-    client = paramiko.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client = new_ssh_client()
 
     try:
         # 连接参数优化
@@ -1,14 +1,15 @@
 import streamlit as st
-import requests
-import paramiko
 import time
 import re
 from typing import Optional, Tuple, Dict, Any
 
-# DeepSeek API configuration
-DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
-API_KEY = "sk-82879fc3191d4718894b5d96ca96da06"  # Consider using environment variables
-HEADERS = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+from services import (
+    DEEPSEEK_API_URL,
+    auth_headers,
+    get_api_key,
+    get_http_session,
+    new_ssh_client,
+)
 
 # Constants
 CISCO_PROMPT_PATTERN = r"[\w-]+(\(config\))?#|>"
@@ -50,7 +51,8 @@ def generate_cisco_command(nl_text: str) -> Optional[str]:
     }
 
     try:
-        response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=payload, timeout=15)
+        headers = auth_headers(get_api_key())
+        response = get_http_session().post(DEEPSEEK_API_URL, headers=headers, json=payload, timeout=15)
         response.raise_for_status()
         return response.json()["choices"][0]["message"]["content"]
     except Exception as e:
@@ -66,8 +68,7 @@ def ssh_execute(
         timeout: int = COMMAND_TIMEOUT
 ) -> Tuple[Optional[str], Optional[Exception]]:
     """Execute commands on Cisco device via SSH with proper output handling."""
-    client = paramiko.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client = new_ssh_client()
 
     try:
         # Enhanced connection parameters
@@ -169,8 +170,7 @@ def main():
         if st.button("测试连接", type="secondary"):
             with st.spinner("正在测试连接..."):
                 try:
-                    client = paramiko.SSHClient()
-                    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                    client = new_ssh_client()
                     client.connect(
                         host,
                         username=username,
@@ -1,8 +1,13 @@
 import streamlit as st
-from transformers import pipeline
 
-# 加载预训练的 LLM（如 GPT-2）
-generator = pipeline("text-generation", model="gpt2")
+from services import load_text_generator
+
+
+# 首次提问时才加载预训练的 LLM（如 GPT-2），之后在进程内复用
+@st.cache_resource(show_spinner="模型加载中...")
+def get_text_generator(model: str = "gpt2"):
+    return load_text_generator(model)
+
 
 # 设置页面标题
 st.title("LLM 对话演示")
@@ -11,6 +16,8 @@ st.title("LLM 对话演示")
 user_input = st.text_input("输入你的问题或提示：")
 
 if user_input:
+    generator = get_text_generator("gpt2")
+
     # 调用模型生成文本
     response = generator(user_input, max_length=100, num_return_sequences=1)
     generated_text = response[0]["generated_text"]
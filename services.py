@@ -0,0 +1,68 @@
+import os
+import importlib
+import threading
+from functools import lru_cache
+from types import ModuleType
+
+# 服务层：重量级依赖首次使用时才导入，配置按需解析，客户端构建后复用。
+# Streamlit 每次交互都会重新执行脚本，但本模块留在 sys.modules 中，缓存在重跑之间保持有效。
+
+DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
+
+
+@lru_cache(maxsize=None)
+def lazy_import(name: str) -> ModuleType:
+    """首次调用时导入模块，之后直接返回缓存"""
+    return importlib.import_module(name)
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """从.env文件加载环境变量（开发环境），只执行一次"""
+    lazy_import("dotenv").load_dotenv()
+
+
+def get_api_key() -> str:
+    """安全获取API密钥，缺失或格式错误时抛出ValueError"""
+    load_env()
+    key = os.getenv("DEEPSEEK_API_KEY")
+    if not key:
+        raise ValueError("DEEPSEEK_API_KEY环境变量未配置")
+    if key.startswith("sk-"):
+        return key
+    raise ValueError("无效的API密钥格式")
+
+
+def auth_headers(api_key: str) -> dict:
+    return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """进程内共享的HTTP会话，首次使用时创建
+
+    Streamlit 几乎每次重跑都会启动新的脚本线程，按线程缓存无法复用连接，因此整个进程共用一个会话。
+    调用方只发送携带独立请求头的无状态请求，不依赖 Cookie，共享是有意为之。
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = lazy_import("requests").Session()
+    return _http_session
+
+
+def new_ssh_client():
+    """创建SSH客户端（每次连接一个新实例）"""
+    paramiko = lazy_import("paramiko")
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    return client
+
+
+def load_text_generator(model: str = "gpt2"):
+    """加载文本生成模型（缓存由调用方通过 st.cache_resource 负责）"""
+    return lazy_import("transformers").pipeline("text-generation", model=model)
@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 仓库根目录下的 streamlit.py 会遮蔽真正的 streamlit 包：先在不含根目录的 sys.path 上导入，再把根目录加回
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != ROOT]
+try:
+    import streamlit
+except ImportError:
+    streamlit = None
+sys.path.append(ROOT)
+
+
+@pytest.fixture
+def st():
+    """真正的 streamlit 包；未安装时跳过测试"""
+    if streamlit is None:
+        pytest.skip("streamlit 未安装")
+    return streamlit
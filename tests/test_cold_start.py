@@ -0,0 +1,57 @@
+import sys
+import threading
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+import services
+from bench_cold_start import APPS, IMPORT_PROBE, run_probe
+
+
+@pytest.mark.parametrize("app", APPS)
+def test_import_does_not_load_heavy_modules(st, app):
+    result = run_probe(IMPORT_PROBE, app)
+    assert "error" not in result, result["error"]
+    assert result["heavy"] == []
+
+
+def test_cisco3_missing_api_key(st, monkeypatch):
+    monkeypatch.delenv("DEEPSEEK_API_KEY", raising=False)
+    monkeypatch.setattr(services, "load_env", lambda: None)
+    monkeypatch.delitem(sys.modules, "CISCO3", raising=False)
+    cisco3 = importlib.import_module("CISCO3")
+
+    errors = []
+    monkeypatch.setattr(cisco3.st, "error", errors.append)
+    assert cisco3.CommandGenerator.generate("配置Gig0/1接口IP") is None
+    assert len(errors) == 1 and "DEEPSEEK_API_KEY" in errors[0]
+
+
+def test_http_session_shared_across_threads(monkeypatch):
+    # Streamlit 每次重跑都在新线程中执行脚本，会话必须跨线程复用
+    monkeypatch.setattr(services, "lazy_import", lambda name: SimpleNamespace(Session=object))
+    monkeypatch.setattr(services, "_http_session", None)
+
+    sessions = []
+    for _ in range(2):
+        thread = threading.Thread(target=lambda: sessions.append(services.get_http_session()))
+        thread.start()
+        thread.join()
+    assert sessions[0] is sessions[1]
+
+
+def test_text_generator_built_once(st, monkeypatch):
+    calls = []
+
+    def pipeline(task, model):
+        calls.append((task, model))
+        return object()
+
+    monkeypatch.setattr(services, "lazy_import", lambda name: SimpleNamespace(pipeline=pipeline))
+    monkeypatch.delitem(sys.modules, "main", raising=False)
+    main = importlib.import_module("main")
+    main.get_text_generator.clear()
+
+    assert main.get_text_generator("gpt2") is main.get_text_generator("gpt2")
+    assert calls == [("text-generation", "gpt2")]